@@ -32,14 +32,21 @@ from ..sql import util as sql_util
 
 _new_runid = util.counter()
 
+# wildcard undefer() used by load_scalar_attributes(); the option is
+# unbound so a single instance can be applied against each per-refresh
+# aliased entity
+_undefer_all = strategy_options.undefer._unbound_fn("*")
+
 
 def instances(query, cursor, context):
     """Return an ORM result as an iterator."""
 
     context.runid = _new_runid()
     context.post_load_paths = {}
+    context.result_getters = {}
 
     filtered = query._has_mapper_entities
+    yield_per = query._yield_per
 
     single_entity = (
         not query._only_return_tuples
@@ -68,38 +75,50 @@ def instances(query, cursor, context):
             )
         )
 
-        if not single_entity:
+        if single_entity:
+            proc = process[0]
+        else:
             keyed_tuple = util.lightweight_named_tuple("result", labels)
 
         while True:
             context.partials = {}
 
-            if query._yield_per:
-                fetch = cursor.fetchmany(query._yield_per)
+            if yield_per:
+                fetch = cursor.fetchmany(yield_per)
                 if not fetch:
                     break
             else:
                 fetch = cursor.fetchall()
 
             if single_entity:
-                proc = process[0]
                 rows = [proc(row) for row in fetch]
+                if filtered:
+                    rows = util.unique_list(rows, filter_fn)
+            elif filtered:
+                # uniquify the tuples as they're produced, so that
+                # filter_fn() is called only once per row
+                rows = []
+                seen = set()
+                for row in fetch:
+                    tup = keyed_tuple([proc(row) for proc in process])
+                    key = filter_fn(tup)
+                    if key not in seen:
+                        seen.add(key)
+                        rows.append(tup)
             else:
                 rows = [
                     keyed_tuple([proc(row) for proc in process])
                     for row in fetch
                 ]
 
-            for path, post_load in context.post_load_paths.items():
-                post_load.invoke(context, path)
-
-            if filtered:
-                rows = util.unique_list(rows, filter_fn)
+            if context.post_load_paths:
+                for path, post_load in context.post_load_paths.items():
+                    post_load.invoke(context, path)
 
             for row in rows:
                 yield row
 
-            if not query._yield_per:
+            if not yield_per:
                 break
     except Exception as err:
         cursor.close()
@@ -235,28 +254,22 @@ def load_on_pk_identity(
         # None present in ident - turn those comparisons
         # into "IS NULL"
         if None in primary_key_identity:
-            nones = set(
-                [
-                    _get_params[col].key
-                    for col, value in zip(
-                        mapper.primary_key, primary_key_identity
-                    )
-                    if value is None
-                ]
-            )
+            nones = {
+                _get_params[col].key
+                for col, value in zip(mapper.primary_key, primary_key_identity)
+                if value is None
+            }
             _get_clause = sql_util.adapt_criterion_to_null(_get_clause, nones)
 
         _get_clause = q._adapt_clause(_get_clause, True, False)
         q._criterion = _get_clause
 
-        params = dict(
-            [
-                (_get_params[primary_key].key, id_val)
-                for id_val, primary_key in zip(
-                    primary_key_identity, mapper.primary_key
-                )
-            ]
-        )
+        params = {
+            _get_params[primary_key].key: id_val
+            for id_val, primary_key in zip(
+                primary_key_identity, mapper.primary_key
+            )
+        }
 
         q._params = params
 
@@ -400,9 +413,9 @@ def _instance_processor(
                 if adapter:
                     adapted_col = adapter.columns[col]
                     if adapted_col is not None:
-                        getter = result._getter(adapted_col, False)
+                        getter = _column_getter(context, result, adapted_col)
                 if not getter:
-                    getter = result._getter(col, False)
+                    getter = _column_getter(context, result, col)
                 if getter:
                     populators["quick"].append((prop.key, getter))
                 else:
@@ -417,25 +430,51 @@ def _instance_processor(
                 context, path, mapper, result, adapter, populators
             )
 
-    propagate_options = context.propagate_options
-    load_path = (
-        context.query._current_path + path
-        if context.query._current_path.path
-        else path
+    if (
+        populators["new"]
+        or populators["delayed"]
+        or populators["expire"]
+        or populators["existing"]
+    ):
+        populate_full = _populate_full
+    else:
+        populate_full = _populate_quick
+
+    # keys from the "expire" populators which are to be marked as expired
+    # on each newly loaded state
+    expire_keys = frozenset(
+        key for key, set_callable in populators["expire"] if set_callable
     )
 
-    session_identity_map = context.session.identity_map
+    propagate_options = context.propagate_options
+    current_path = context.query._current_path
+    if current_path.path:
+        # sub-mapper processors set up for polymorphic loading share
+        # the same joined path
+        key = ("load_path", path.path)
+        load_path = context.attributes.get(key)
+        if load_path is None:
+            load_path = context.attributes[key] = current_path + path
+    else:
+        load_path = path
+
+    session = context.session
+    session_identity_map = session.identity_map
+    session_identity_map_get = session_identity_map.get
+    session_identity_map_add_unpresent = session_identity_map._add_unpresent
 
     populate_existing = context.populate_existing or mapper.always_refresh
     load_evt = bool(mapper.class_manager.dispatch.load)
     refresh_evt = bool(mapper.class_manager.dispatch.refresh)
-    persistent_evt = bool(context.session.dispatch.loaded_as_persistent)
+    persistent_evt = bool(session.dispatch.loaded_as_persistent)
     if persistent_evt:
-        loaded_as_persistent = context.session.dispatch.loaded_as_persistent
+        loaded_as_persistent = session.dispatch.loaded_as_persistent
     instance_state = attributes.instance_state
     instance_dict = attributes.instance_dict
-    session_id = context.session.hash_key
+    new_instance = mapper.class_manager.new_instance
+    session_id = session.hash_key
     version_check = context.version_check
+    invoke_all_eagers = context.invoke_all_eagers
     runid = context.runid
     identity_token = context.identity_token
 
@@ -488,13 +527,50 @@ def _instance_processor(
 
         if adapter:
             pk_cols = [adapter.columns[c] for c in pk_cols]
-        tuple_getter = result._tuple_getter(pk_cols, True)
+        tuple_getter = _tuple_getter(context, result, pk_cols)
+
+    # the primary key values here come from result rows, so the only
+    # member of _none_set they can match is None.  specialize the common
+    # one and two column cases so that no set operation is needed per row.
+    num_pk_cols = len(mapper.primary_key)
+    if num_pk_cols == 1:
+
+        def is_not_primary_key(identity):
+            return identity[0] is None
+
+    elif num_pk_cols == 2 and mapper.allow_partial_pks:
+
+        def is_not_primary_key(identity):
+            return identity[0] is None and identity[1] is None
+
+    elif num_pk_cols == 2:
+
+        def is_not_primary_key(identity):
+            return identity[0] is None or identity[1] is None
 
-    if mapper.allow_partial_pks:
+    elif mapper.allow_partial_pks:
         is_not_primary_key = _none_set.issuperset
     else:
         is_not_primary_key = _none_set.intersection
 
+    # these conditions are fixed for the lifespan of this row processor;
+    # resolve them up front so that _instance() doesn't re-test them for
+    # every row.
+    set_load_path = bool(propagate_options or not populate_existing)
+    commit_only_load_props = bool(refresh_state and only_load_props)
+    post_load_partials = bool(post_load and invoke_all_eagers)
+    eager_populators = populators["eager"]
+
+    # when collections are joined eagerly loaded, rows for the same
+    # identity arrive adjacent to each other.  keep track of the most
+    # recently located identity and its state so that repeated rows can
+    # skip the identity map lookup.  yield_per is not compatible with
+    # joined collection loading, so the whole result here is processed
+    # in one fetch without the application getting a chance to modify
+    # the Session in between rows.
+    track_identity = context.multi_row_eager_loaders
+    located = [None, None]
+
     def _instance(row):
 
         # determine the state that we'll be populating
@@ -509,15 +585,24 @@ def _instance_processor(
         else:
             # look at the row, see if that identity is in the
             # session, or we have to create a new one
-            identitykey = (identity_class, tuple_getter(row), identity_token)
+            identity = tuple_getter(row)
+
+            if track_identity and identity == located[0]:
+                instance, state, dict_ = located[1]
+            else:
+                identitykey = (identity_class, identity, identity_token)
 
-            instance = session_identity_map.get(identitykey)
+                instance = session_identity_map_get(identitykey)
+
+                if instance is not None:
+                    state = instance_state(instance)
+                    dict_ = instance_dict(instance)
+
+                    if track_identity:
+                        located[:] = identity, (instance, state, dict_)
 
             if instance is not None:
                 # existing instance
-                state = instance_state(instance)
-                dict_ = instance_dict(instance)
-
                 isnew = state.runid != runid
                 currentload = not isnew
                 loaded_instance = False
@@ -537,7 +622,7 @@ def _instance_processor(
                 currentload = True
                 loaded_instance = True
 
-                instance = mapper.class_manager.new_instance()
+                instance = new_instance()
 
                 dict_ = instance_dict(instance)
                 state = instance_state(instance)
@@ -546,7 +631,10 @@ def _instance_processor(
 
                 # attach instance to session.
                 state.session_id = session_id
-                session_identity_map._add_unpresent(state, identitykey)
+                session_identity_map_add_unpresent(state, identitykey)
+
+                if track_identity:
+                    located[:] = identity, (instance, state, dict_)
 
         # populate.  this looks at whether this state is new
         # for this load or was existing, and whether or not this
@@ -558,11 +646,11 @@ def _instance_processor(
             # be conservative about setting load_path when populate_existing
             # is in effect; want to maintain options from the original
             # load.  see test_expire->test_refresh_maintains_deferred_options
-            if isnew and (propagate_options or not populate_existing):
+            if isnew and set_load_path:
                 state.load_options = propagate_options
                 state.load_path = load_path
 
-            _populate_full(
+            populate_full(
                 context,
                 row,
                 state,
@@ -572,6 +660,7 @@ def _instance_processor(
                 loaded_instance,
                 populate_existing,
                 populators,
+                expire_keys,
             )
 
             if isnew:
@@ -579,14 +668,14 @@ def _instance_processor(
                     if load_evt:
                         state.manager.dispatch.load(state, context)
                     if persistent_evt:
-                        loaded_as_persistent(context.session, state.obj())
+                        loaded_as_persistent(session, instance)
                 elif refresh_evt:
                     state.manager.dispatch.refresh(
                         state, context, only_load_props
                     )
 
                 if populate_existing or state.modified:
-                    if refresh_state and only_load_props:
+                    if commit_only_load_props:
                         state._commit(dict_, only_load_props)
                     else:
                         state._commit_all(dict_, session_identity_map)
@@ -601,7 +690,7 @@ def _instance_processor(
             unloaded = state.unloaded
             isnew = state not in context.partials
 
-            if not isnew or unloaded or populators["eager"]:
+            if not isnew or unloaded or eager_populators:
                 # state is having a partial set of its attributes
                 # refreshed.  Populate those attributes,
                 # and add to the "context.partials" collection.
@@ -623,7 +712,7 @@ def _instance_processor(
 
                     state._commit(dict_, to_load)
 
-            if post_load and context.invoke_all_eagers:
+            if post_load_partials:
                 post_load.add_state(state, False)
 
         return instance
@@ -632,11 +721,7 @@ def _instance_processor(
         # if we are doing polymorphic, dispatch to a different _instance()
         # method specific to the subclass mapper
         def ensure_no_pk(row):
-            identitykey = (
-                identity_class,
-                tuple([row[column] for column in pk_cols]),
-                identity_token,
-            )
+            identitykey = (identity_class, tuple_getter(row), identity_token)
             if not is_not_primary_key(identitykey[1]):
                 raise sa_exc.InvalidRequestError(
                     "Row with identity key %s can't be loaded into an "
@@ -658,6 +743,34 @@ def _instance_processor(
     return _instance
 
 
+def _column_getter(context, result, column):
+    """Return ``result._getter(column, False)``, memoized for the
+    lifespan of the result.
+
+    Sub-mapper row processors created during polymorphic loading
+    mostly request getters for the same columns as the base mapper.
+
+    """
+    getters = context.result_getters
+    if column in getters:
+        return getters[column]
+    getter = getters[column] = result._getter(column, False)
+    return getter
+
+
+def _tuple_getter(context, result, columns):
+    """Return ``result._tuple_getter(columns)``, memoized for the
+    lifespan of the result.
+
+    """
+    getters = context.result_getters
+    key = tuple(columns)
+    if key in getters:
+        return getters[key]
+    getter = getters[key] = result._tuple_getter(columns, True)
+    return getter
+
+
 def _load_subclass_via_in(context, path, entity):
     mapper = entity.mapper
 
@@ -680,12 +793,12 @@ def _load_subclass_via_in(context, path, entity):
         if orig_query._populate_existing:
             q2.add_criteria(lambda q: q.populate_existing())
 
-        q2(context.session).params(
-            primary_keys=[
-                state.key[1][0] if zero_idx else state.key[1]
-                for state, load_attrs in states
-            ]
-        ).all()
+        if zero_idx:
+            primary_keys = [state.key[1][0] for state, load_attrs in states]
+        else:
+            primary_keys = [state.key[1] for state, load_attrs in states]
+
+        q2(context.session).params(primary_keys=primary_keys).all()
 
     return do_load
 
@@ -700,6 +813,7 @@ def _populate_full(
     loaded_instance,
     populate_existing,
     populators,
+    expire_keys,
 ):
     if isnew:
         # first time we are seeing a row with this identity.
@@ -710,12 +824,8 @@ def _populate_full(
         if populate_existing:
             for key, set_callable in populators["expire"]:
                 dict_.pop(key, None)
-                if set_callable:
-                    state.expired_attributes.add(key)
-        else:
-            for key, set_callable in populators["expire"]:
-                if set_callable:
-                    state.expired_attributes.add(key)
+        if expire_keys:
+            state.expired_attributes.update(expire_keys)
         for key, populator in populators["new"]:
             populator(state, dict_, row)
         for key, populator in populators["delayed"]:
@@ -747,6 +857,35 @@ def _populate_full(
             # populator(state, dict_, row, new_path=False)
 
 
+def _populate_quick(
+    context,
+    row,
+    state,
+    dict_,
+    isnew,
+    load_path,
+    loaded_instance,
+    populate_existing,
+    populators,
+    expire_keys,
+):
+    """A version of _populate_full() for the common case where the
+    only populators present are "quick" column populators.
+
+    """
+    if isnew:
+        state.runid = context.runid
+
+        for key, getter in populators["quick"]:
+            dict_[key] = getter(row)
+    elif load_path != state.load_path:
+        state.load_path = load_path
+
+        for key, getter in populators["quick"]:
+            if key not in dict_:
+                dict_[key] = getter(row)
+
+
 def _populate_partial(
     context, row, state, dict_, isnew, load_path, unloaded, populators
 ):
@@ -902,6 +1041,8 @@ class PostLoad(object):
 
     @classmethod
     def for_context(cls, context, path, only_load_props):
+        if not context.post_load_paths:
+            return None
         pl = context.post_load_paths.get(path.path)
         if pl is not None and only_load_props:
             pl.load_keys = only_load_props
@@ -925,19 +1066,25 @@ class PostLoad(object):
         pl.loaders[token] = (token, limit_to_mapper, loader_callable, arg, kw)
 
 
-def load_scalar_attributes(mapper, state, attribute_names):
+@util.dependencies("sqlalchemy.orm.session")
+def load_scalar_attributes(sessionlib, mapper, state, attribute_names):
     """initiate a column-based attribute refresh operation."""
 
     # assert mapper is _state_mapper(state)
-    session = state.session
-    if not session:
+
+    # same as state.session, without the property and the
+    # _state_session() call
+    session = (
+        sessionlib._sessions.get(state.session_id)
+        if state.session_id
+        else None
+    )
+    if session is None:
         raise orm_exc.DetachedInstanceError(
             "Instance %s is not bound to a Session; "
             "attribute refresh operation cannot proceed" % (state_str(state))
         )
 
-    has_key = bool(state.key)
-
     result = False
 
     # in the case of inheritance, particularly concrete and abstract
@@ -945,11 +1092,18 @@ def load_scalar_attributes(mapper, state, attribute_names):
     # of attributes on the superclass that we didn't actually map.
     # These could be mapped as "concrete, dont load" or could be completely
     # exluded from the mapping and we know nothing about them.  Filter them
-    # here to prevent them from coming through.
+    # here to prevent them from coming through.  attribute_names is a
+    # new set built by InstanceState._load_expired(), so it's filtered
+    # in place.
     if attribute_names:
-        attribute_names = attribute_names.intersection(mapper.attrs.keys())
+        attribute_names &= mapper._attrs_keyset
 
-    if mapper.inherits and not mapper.concrete:
+    # skip the optimized get when any requested attribute lives on the
+    # base table, as _optimized_get_statement() would return None anyway
+    if mapper._uses_optimized_get and (
+        not attribute_names
+        or attribute_names.isdisjoint(mapper._base_table_attr_keys)
+    ):
         # because we are using Core to produce a select() that we
         # pass to the Query, we aren't calling setup() for mapped
         # attributes; in 1.0 this means deferred attrs won't get loaded
@@ -959,7 +1113,7 @@ def load_scalar_attributes(mapper, state, attribute_names):
             wp = aliased(mapper, statement)
             result = load_on_ident(
                 session.query(wp)
-                .options(strategy_options.Load(wp).undefer("*"))
+                .options(_undefer_all)
                 .from_statement(statement),
                 None,
                 only_load_props=attribute_names,
@@ -967,37 +1121,35 @@ def load_scalar_attributes(mapper, state, attribute_names):
             )
 
     if result is False:
-        if has_key:
-            identity_key = state.key
-        else:
-            # this codepath is rare - only valid when inside a flush, and the
-            # object is becoming persistent but hasn't yet been assigned
-            # an identity_key.
-            # check here to ensure we have the attrs we need.
-            pk_attrs = [
-                mapper._columntoproperty[col].key for col in mapper.primary_key
-            ]
-            if state.expired_attributes.intersection(pk_attrs):
-                raise sa_exc.InvalidRequestError(
-                    "Instance %s cannot be refreshed - it's not "
-                    " persistent and does not "
-                    "contain a full primary key." % state_str(state)
-                )
-            identity_key = mapper._identity_key_from_state(state)
+        identity_key = state.key
+        if identity_key is None:
+            identity_key = _pending_identity_key(mapper, state)
 
         if (
-            _none_set.issubset(identity_key) and not mapper.allow_partial_pks
+            not mapper.allow_partial_pks and _none_set.issubset(identity_key)
         ) or _none_set.issuperset(identity_key):
             util.warn_limited(
                 "Instance %s to be refreshed doesn't "
                 "contain a full primary key - can't be refreshed "
                 "(and shouldn't be expired, either).",
-                state_str(state),
+                (state_str(state),),
             )
             return
 
+        # the mapper memoizes a plain Query to start from; a custom
+        # query_cls may configure itself from the session, and a Session
+        # subclass may override query(), so in those cases go through
+        # session.query() as usual
+        q = mapper._refresh_query
+        if session._query_cls is q.__class__ and util.methods_equivalent(
+            type(session).query, sessionlib.Session.query
+        ):
+            q = q.with_session(session)
+        else:
+            q = session.query(mapper)
+
         result = load_on_ident(
-            session.query(mapper),
+            q,
             identity_key,
             refresh_state=state,
             only_load_props=attribute_names,
@@ -1005,5 +1157,23 @@ def load_scalar_attributes(mapper, state, attribute_names):
 
     # if instance is pending, a refresh operation
     # may not complete (even if PK attributes are assigned)
-    if has_key and result is None:
+    if result is None and state.key is not None:
         raise orm_exc.ObjectDeletedError(state)
+
+
+def _pending_identity_key(mapper, state):
+    """Return the identity key for a state that is being refreshed before
+    it has been assigned one.
+
+    This codepath is rare - only valid when inside a flush, and the object
+    is becoming persistent but hasn't yet been assigned an identity_key.
+
+    """
+    # check here to ensure we have the attrs we need.
+    if not state.expired_attributes.isdisjoint(mapper._pk_attr_keys):
+        raise sa_exc.InvalidRequestError(
+            "Instance %s cannot be refreshed - it's not "
+            " persistent and does not "
+            "contain a full primary key." % state_str(state)
+        )
+    return mapper._identity_key_from_state(state)
@@ -1004,6 +1004,10 @@ class Mapper(InspectionAttr):
         # a set of all mappers which inherit from this one.
         self._inheriting_mappers = util.WeakSequence()
 
+        # whether load_scalar_attributes() should try
+        # _optimized_get_statement() first
+        self._uses_optimized_get = bool(self.inherits and not self.concrete)
+
         if self.inherits:
             if isinstance(self.inherits, type):
                 self.inherits = class_mapper(self.inherits, configure=False)
@@ -2789,6 +2793,14 @@ class Mapper(InspectionAttr):
     def _primary_key_propkeys(self):
         return {prop.key for prop in self._all_pk_props}
 
+    @_memoized_configured_property
+    def _pk_attr_keys(self):
+        return frozenset(prop.key for prop in self._identity_key_props)
+
+    @_memoized_configured_property
+    def _attrs_keyset(self):
+        return frozenset(self.attrs.keys())
+
     def _get_state_attr_by_column(
         self, state, dict_, column, passive=attributes.PASSIVE_RETURN_NO_VALUE
     ):
@@ -2819,6 +2831,24 @@ class Mapper(InspectionAttr):
             state, dict_, passive=passive
         )
 
+    @_memoized_configured_property
+    def _base_table_attr_keys(self):
+        """keys of column attributes which refer to the base mapper's
+        local table; requesting any of these means
+        :meth:`._optimized_get_statement` can't minimize the tables
+        and will return None.
+
+        """
+        base_table = self.base_mapper.local_table
+        return frozenset(
+            key
+            for key, prop in self.column_attrs.items()
+            if any(
+                base_table in sql_util.find_tables(c, check_columns=True)
+                for c in prop.columns
+            )
+        )
+
     def _optimized_get_statement(self, state, attribute_names):
         """assemble a WHERE clause which retrieves a given state by primary
         key, using a minimized set of tables.
@@ -2910,6 +2940,15 @@ class Mapper(InspectionAttr):
             cols.extend(props[key].columns)
         return sql.select(cols, cond, use_labels=True)
 
+    @_memoized_configured_property
+    @util.dependencies("sqlalchemy.orm.query")
+    def _refresh_query(self, querylib):
+        """A session-less :class:`.Query` against this mapper, used as the
+        starting point for attribute refresh operations.
+
+        """
+        return querylib.Query([self])
+
     def _iterate_to_target_viawpoly(self, mapper):
         if self.isa(mapper):
             prev = self
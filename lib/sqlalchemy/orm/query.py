@@ -4682,6 +4682,7 @@ class QueryContext(object):
         "runid",
         "partials",
         "post_load_paths",
+        "result_getters",
         "identity_token",
         "single_inh_entities",
     )
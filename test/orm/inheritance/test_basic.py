@@ -2542,6 +2542,37 @@ class OptimizedLoadTest(fixtures.MappedTest):
 
             eq_(s1.sub, "s1sub")
 
+    def test_optimized_get_skipped_for_base_table_attrs(self):
+        base, sub = self.tables.base, self.tables.sub
+
+        class Base(fixtures.ComparableEntity):
+            pass
+
+        class Sub(Base):
+            pass
+
+        mapper(
+            Base, base, polymorphic_on=base.c.type, polymorphic_identity="base"
+        )
+        mapper(Sub, sub, inherits=Base, polymorphic_identity="sub")
+
+        eq_(
+            class_mapper(Sub)._base_table_attr_keys,
+            set(["id", "data", "type", "counter"]),
+        )
+
+        sess = Session()
+        s1 = Sub(data="s1data", sub="s1sub")
+        sess.add(s1)
+        sess.commit()
+
+        sess.expire(s1, ["data"])
+        with mock.patch.object(
+            class_mapper(Sub), "_optimized_get_statement"
+        ) as m:
+            eq_(s1.data, "s1data")
+        eq_(m.mock_calls, [])
+
     def test_optimized_passes(self):
         """"test that the 'optimized load' routine doesn't crash when
         a column in the join condition is not available."""
@@ -16,6 +16,7 @@ from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import lazyload
 from sqlalchemy.orm import make_transient_to_detached
 from sqlalchemy.orm import mapper
+from sqlalchemy.orm import Query
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import strategies
@@ -25,6 +26,7 @@ from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import mock
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
 from sqlalchemy.testing.util import gc_collect
@@ -307,6 +309,68 @@ class ExpireTest(_fixtures.FixtureTest):
 
         self.assert_sql_count(testing.db, go, 0)
 
+    def test_expire_refresh_uses_memoized_query(self):
+        users, User = self.tables.users, self.classes.User
+
+        m = mapper(User, users)
+
+        s = create_session()
+        u = s.query(User).get(7)
+        s.expire(u, ["name"])
+
+        with mock.patch.object(
+            Query,
+            "with_session",
+            autospec=True,
+            side_effect=Query.with_session,
+        ) as with_session, mock.patch.object(
+            s, "query", wraps=s.query
+        ) as session_query:
+            eq_(u.name, "jack")
+
+        eq_(with_session.mock_calls, [mock.call(m._refresh_query, s)])
+        eq_(session_query.mock_calls, [])
+
+    def test_expire_refresh_uses_query_cls(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+
+        canary = []
+
+        class MyQuery(Query):
+            def __init__(self, entities, session=None):
+                canary.append(entities)
+                super(MyQuery, self).__init__(entities, session)
+
+        s = create_session(query_cls=MyQuery)
+        u = s.query(User).get(7)
+        s.expire(u, ["name"])
+        canary[:] = []
+
+        eq_(u.name, "jack")
+        eq_(len(canary), 1)
+
+    def test_expire_refresh_uses_session_query_override(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+
+        canary = []
+
+        class MySession(Session):
+            def query(self, *entities, **kw):
+                canary.append(entities)
+                return super(MySession, self).query(*entities, **kw)
+
+        s = MySession()
+        u = s.query(User).get(7)
+        s.expire(u, ["name"])
+        canary[:] = []
+
+        eq_(u.name, "jack")
+        eq_(len(canary), 1)
+
     def test_expire_doesntload_on_set(self):
         User, users = self.classes.User, self.tables.users
 
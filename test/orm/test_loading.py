@@ -1,6 +1,8 @@
 from sqlalchemy import exc
 from sqlalchemy import select
+from sqlalchemy import util
 from sqlalchemy.orm import aliased
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import loading
 from sqlalchemy.orm import Session
 from sqlalchemy.testing import mock
@@ -52,6 +54,68 @@ class InstancesTest(_fixtures.FixtureTest):
             q.from_statement(stmt).all,
         )
 
+    def test_keyed_tuple_rows(self):
+        User = self.classes.User
+        s = Session()
+
+        q = s.query(User.id, User.name).order_by(User.id)
+        rows = q.all()
+        eq_(rows, [(7, "jack"), (8, "ed"), (9, "fred"), (10, "chuck")])
+        eq_(rows[0].keys(), ["id", "name"])
+        eq_(rows[0].name, "jack")
+
+    def _assert_user_addresses(self, users):
+        eq_(
+            [(u.id, sorted(a.id for a in u.addresses)) for u in users],
+            [(7, [1]), (8, [2, 3, 4]), (9, [5]), (10, [])],
+        )
+
+    def _user_lookups(self, s, fn):
+        User = self.classes.User
+
+        with mock.patch.object(
+            s.identity_map, "get", wraps=s.identity_map.get
+        ) as get:
+            result = fn()
+        return result, [c for c in get.mock_calls if c[1][0][0] is User]
+
+    def test_joined_collection_identity_located_once(self):
+        User = self.classes.User
+        s = Session()
+
+        q = s.query(User).options(joinedload(User.addresses)).order_by(User.id)
+
+        users, lookups = self._user_lookups(s, q.all)
+        self._assert_user_addresses(users)
+
+        # six rows, four distinct users; repeated rows for user 8
+        # reuse the previously located state
+        eq_(len(lookups), 4)
+
+        users2, lookups = self._user_lookups(s, q.populate_existing().all)
+        eq_([id(u) for u in users2], [id(u) for u in users])
+        self._assert_user_addresses(users2)
+        eq_(len(lookups), 4)
+
+    def test_joined_collection_identity_multi_entity(self):
+        User, Address = self.classes.User, self.classes.Address
+        s = Session()
+
+        q = (
+            s.query(User, Address)
+            .outerjoin(User.addresses)
+            .options(joinedload(User.addresses))
+            .order_by(User.id, Address.id)
+        )
+        rows, lookups = self._user_lookups(s, q.all)
+        eq_(
+            [(u.id, a.id if a is not None else None) for u, a in rows],
+            [(7, 1), (8, 2), (8, 3), (8, 4), (9, 5), (10, None)],
+        )
+        assert rows[1][0] is rows[2][0] is rows[3][0]
+        self._assert_user_addresses(util.unique_list(u for u, a in rows))
+        eq_(len(lookups), 4)
+
 
 class MergeResultTest(_fixtures.FixtureTest):
     run_setup_mappers = "once"